@@ -1,6 +1,10 @@
 import pandas as pd
 import pandera.pandas as pa
 
+# Stop collecting failure cases after this many per check during
+# lazy validation; otherwise memory grows with the number of bad rows
+N_FAILURE_CASES = 10
+
 historical_prices_schema = pa.DataFrameSchema(
     {
         "date": pa.Column(pd.Timestamp, nullable=False),
@@ -37,36 +41,33 @@ aggregated_news_schema = pa.DataFrameSchema(
     coerce=True
 )
 
-historical_prices_impact_schema = pa.DataFrameSchema(
-    {
-        "date": pa.Column(pd.Timestamp, nullable=False),
-        "symbol": pa.Column(str, nullable=False),
-        "open": pa.Column(float, nullable=False),
-        "high": pa.Column(float, nullable=False),
-        "low": pa.Column(float, nullable=False),
-        "close": pa.Column(float, nullable=False),
-        "volume": pa.Column(int, nullable=False),
-        "daily_return": pa.Column(float, nullable=False),
-        "daily_volatility": pa.Column(float, nullable=False),
-        "market_return": pa.Column(float, nullable=False),
-        "beta": pa.Column(float, nullable=False),
-        "alpha": pa.Column(float, nullable=False),
-        "idiosyn_return": pa.Column(float, nullable=False),
-        "idiosyn_volatility": pa.Column(float, nullable=False),
-        "market_adj_return": pa.Column(float, nullable=False),
-        "market_adj_volatility": pa.Column(float, nullable=False),
-        "impact_score": pa.Column(float, nullable=False),
-    },
-    coerce=True
+# Impact metric columns added on top of the base OHLCV schema
+IMPACT_METRIC_COLUMNS = [
+    "daily_return",
+    "daily_volatility",
+    "market_return",
+    "beta",
+    "alpha",
+    "idiosyn_return",
+    "idiosyn_volatility",
+    "market_adj_return",
+    "market_adj_volatility",
+    "impact_score",
+]
+
+# Derived from historical_prices_schema so the shared OHLCV columns are
+# defined in exactly one place
+historical_prices_impact_schema = historical_prices_schema.add_columns(
+    {name: pa.Column(float, nullable=False) for name in IMPACT_METRIC_COLUMNS}
 )
 
 trade_log_schema = pa.DataFrameSchema(
     {
         "date": pa.Column(pd.Timestamp, nullable=False),
         "symbol": pa.Column(str, nullable=False),
-        "trade_type": pa.Column(str, pa.Check.isin(["Buy", "Sell"]), nullable=False),
-        "shares": pa.Column(int, pa.Check.ge(0), nullable=False),
-        "price": pa.Column(float, pa.Check.ge(0), nullable=False),
+        "trade_type": pa.Column(str, pa.Check.isin(["Buy", "Sell"], n_failure_cases=N_FAILURE_CASES), nullable=False),
+        "shares": pa.Column(int, pa.Check.ge(0, n_failure_cases=N_FAILURE_CASES), nullable=False),
+        "price": pa.Column(float, pa.Check.ge(0, n_failure_cases=N_FAILURE_CASES), nullable=False),
         "trans_amount": pa.Column(float, nullable=False),
         "cash_after_trade": pa.Column(float, nullable=False),
         "news_headline": pa.Column(str, nullable=True),
@@ -0,0 +1,88 @@
+"""
+Polars-backend mirrors of the schemas in dataset_schema.py.
+
+Pandera's Polars backend fuses column checks into a single lazy query
+plan, which is much faster than the pandas backend on large CSVs. Used
+by utils.load_and_validate_csv when backend='polars'.
+"""
+
+import polars as pl
+import pandera.polars as pa
+
+from dataset_schema import IMPACT_METRIC_COLUMNS
+
+historical_prices_schema = pa.DataFrameSchema(
+    {
+        "date": pa.Column(pl.Datetime, nullable=False),
+        "symbol": pa.Column(pl.Utf8, nullable=False),
+        "open": pa.Column(pl.Float64, nullable=False),
+        "high": pa.Column(pl.Float64, nullable=False),
+        "low": pa.Column(pl.Float64, nullable=False),
+        "close": pa.Column(pl.Float64, nullable=False),
+        "volume": pa.Column(pl.Int64, nullable=False),
+    },
+    coerce=True
+)
+
+all_news_schema = pa.DataFrameSchema(
+    {
+        "id": pa.Column(pl.Int64, nullable=False),
+        "headline": pa.Column(pl.Utf8, nullable=False),
+        "URL": pa.Column(pl.Utf8, nullable=False),
+        "article": pa.Column(pl.Utf8, nullable=False),
+        "publisher": pa.Column(pl.Utf8, nullable=False),
+        "date": pa.Column(pl.Datetime, nullable=False),
+        "symbol": pa.Column(pl.Utf8, nullable=True),  # Symbol can be null for general news
+    },
+    coerce=True
+)
+
+aggregated_news_schema = pa.DataFrameSchema(
+    {
+        "symbol": pa.Column(pl.Utf8, nullable=False),
+        "date": pa.Column(pl.Datetime, nullable=False),
+        "news": pa.Column(pl.Utf8, nullable=False),
+    },
+    coerce=True
+)
+
+# Derived from historical_prices_schema with the shared impact metric
+# column names, mirroring dataset_schema.py
+historical_prices_impact_schema = historical_prices_schema.add_columns(
+    {name: pa.Column(pl.Float64, nullable=False) for name in IMPACT_METRIC_COLUMNS}
+)
+
+trade_log_schema = pa.DataFrameSchema(
+    {
+        "date": pa.Column(pl.Datetime, nullable=False),
+        "symbol": pa.Column(pl.Utf8, nullable=False),
+        "trade_type": pa.Column(pl.Utf8, pa.Check.isin(["Buy", "Sell"]), nullable=False),
+        "shares": pa.Column(pl.Int64, pa.Check.ge(0), nullable=False),
+        "price": pa.Column(pl.Float64, pa.Check.ge(0), nullable=False),
+        "trans_amount": pa.Column(pl.Float64, nullable=False),
+        "cash_after_trade": pa.Column(pl.Float64, nullable=False),
+        "news_headline": pa.Column(pl.Utf8, nullable=True),
+        "impact_score": pa.Column(pl.Float64, nullable=True),
+    },
+    coerce=True
+)
+
+trade_log_summary_schema = pa.DataFrameSchema(
+    {
+        "total_gain_loss": pa.Column(pl.Float64, nullable=False),
+        "avg_annual_return_pct": pa.Column(pl.Float64, nullable=False),
+        "total_return_pct": pa.Column(pl.Float64, nullable=False),
+        "final_balance": pa.Column(pl.Float64, nullable=False),
+    },
+    coerce=True
+)
+
+vectorized_news_schema = pa.DataFrameSchema(
+    {
+        "symbol": pa.Column(pl.Utf8, nullable=False),
+        "date": pa.Column(pl.Datetime, nullable=False),
+        "news_vector": pa.Column(pl.Utf8, nullable=False),  # CSV stores vectors as strings
+        "impact_score": pa.Column(pl.Float64, nullable=False),
+    },
+    coerce=True
+)
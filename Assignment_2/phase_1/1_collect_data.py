@@ -15,13 +15,21 @@ Output files:
 - all_news.csv
 """
 
+import asyncio
+import re
+import sqlite3
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import yfinance as yf
+from collections import defaultdict
 from datetime import datetime, timedelta
-import requests
-from bs4 import BeautifulSoup
-from time import sleep
+from urllib.parse import urlparse
+import httpx
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from selectolax.lexbor import LexborHTMLParser
 import os
 import sys
 
@@ -31,6 +39,100 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dataset_schema import historical_prices_schema, all_news_schema
 from utils import load_and_validate_csv
 
+# Headers to mimic a real browser
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://www.google.com/"
+}
+
+# Connection limits for concurrent scraping
+MAX_CONCURRENT_REQUESTS = 32
+MAX_REQUESTS_PER_HOST = 4
+
+# URLs fetched (and rows flushed to Parquet) per batch when streaming
+ARTICLE_BATCH_SIZE = 512
+
+# Collapses runs of whitespace in one C-level pass, without the
+# intermediate substring list that ' '.join(text.split()) builds
+_WS_RE = re.compile(r'\s+')
+
+# Don't bother parsing responses larger than this (bytes)
+MAX_CONTENT_LENGTH = 2_000_000
+
+
+def is_parsable_html(headers):
+    """
+    Check response headers before handing the body to the HTML parser.
+
+    Args:
+        headers: Response headers (mapping with case-insensitive get)
+
+    Returns:
+        False for non-HTML content types (PDFs, images, ...) or bodies
+        declared larger than MAX_CONTENT_LENGTH
+    """
+    if 'html' not in headers.get('Content-Type', '').lower():
+        return False
+
+    try:
+        length = int(headers.get('Content-Length') or 0)
+    except ValueError:
+        length = 0
+
+    return length <= MAX_CONTENT_LENGTH
+
+# Known article-body selectors per publisher, tried in order; one C-level
+# CSS lookup each instead of scanning every div per candidate class name.
+# ([class*="..." i] is the case-insensitive substring match)
+PUBLISHER_SELECTORS = {
+    'Benzinga': ('div[class*="article-body" i]', 'article'),
+    'Seeking Alpha': ('div[data-test-id="article-content"]', 'article'),
+    'Zacks': ('div[class*="commentary_body" i]', 'article'),
+}
+
+# Generic selectors for publishers without a dedicated entry (mirrors the
+# old article-tag-then-known-classes strategy order)
+FALLBACK_SELECTORS = (
+    'article',
+    'div[class*="article-body" i]',
+    'div[class*="article-content" i]',
+    'div[class*="entry-content" i]',
+    'div[class*="post-content" i]',
+    'div[class*="content-body" i]',
+)
+
+# Fixed Arrow schema for streamed all_news batches, so every batch is
+# written identically even when a column is all-null in one batch
+ALL_NEWS_ARROW_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('headline', pa.string()),
+    ('URL', pa.string()),
+    ('article', pa.string()),
+    ('publisher', pa.string()),
+    ('date', pa.timestamp('ns')),
+    ('symbol', pa.string()),
+])
+
+# On-disk URL -> article-text cache (articles never change once
+# published, so entries never expire): re-runs skip the network for
+# already-scraped URLs, and a scrape interrupted mid-run resumes from
+# where it left off
+ARTICLE_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    '.scrape_cache.sqlite'
+)
+
+
+def _open_article_cache(path=ARTICLE_CACHE_PATH):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, article TEXT NOT NULL)"
+    )
+    return conn
+
 
 def download_historical_prices(symbols, start_date="2009-01-01", end_date="2020-12-31"):
     """
@@ -45,48 +147,65 @@ def download_historical_prices(symbols, start_date="2009-01-01", end_date="2020-
         DataFrame with schema: date, symbol, open, high, low, close, volume
     """
     print("Downloading historical prices...")
-    
+
     # Add S&P 500 index (use ^GSPC as symbol, but save as 's&p')
     all_symbols = list(set(symbols)) + ['^GSPC']
-    
+
+    # One batched request for every ticker; yfinance fans the symbols out
+    # over its own thread pool instead of one serial round-trip each
+    print(f"  Downloading {len(all_symbols)} symbols in one batch...")
+    raw = yf.download(
+        all_symbols,
+        start=start_date,
+        end=end_date,
+        group_by='ticker',
+        threads=True,
+        progress=False,
+        auto_adjust=True  # Close is then already adjusted close
+    )
+
+    if raw is None or raw.empty:
+        raise ValueError("No historical price data could be downloaded")
+
     all_data = []
-    
+
     for symbol in all_symbols:
-        print(f"  Downloading {symbol}...")
         try:
-            # Download data using yfinance
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(start=start_date, end=end_date)
-            
-            if df.empty:
-                print(f"    Warning: No data found for {symbol}")
-                continue
-            
-            # Reset index to get date as column
-            df = df.reset_index()
-            
-            # Rename columns to match schema
-            df = df.rename(columns={
-                'Date': 'date',
-                'Open': 'open',
-                'High': 'high',
-                'Low': 'low',
-                'Close': 'close',  # yfinance Close is already adjusted close
-                'Volume': 'volume'
-            })
-            
-            # Add symbol column (use 's&p' for S&P 500)
-            df['symbol'] = 's&p' if symbol == '^GSPC' else symbol
-            
-            # Select only required columns
-            df = df[['date', 'symbol', 'open', 'high', 'low', 'close', 'volume']]
-            
-            all_data.append(df)
-            
-        except Exception as e:
-            print(f"    Error downloading {symbol}: {e}")
+            # With group_by='ticker' the result has one column group per
+            # symbol (single-symbol downloads come back flat)
+            df = raw[symbol] if len(all_symbols) > 1 else raw
+        except KeyError:
+            print(f"    Warning: No data found for {symbol}")
             continue
-    
+
+        # Failed tickers show up as all-NaN column groups
+        df = df.dropna(how='all')
+
+        if df.empty:
+            print(f"    Warning: No data found for {symbol}")
+            continue
+
+        # Reset index to get date as column
+        df = df.reset_index()
+
+        # Rename columns to match schema
+        df = df.rename(columns={
+            'Date': 'date',
+            'Open': 'open',
+            'High': 'high',
+            'Low': 'low',
+            'Close': 'close',
+            'Volume': 'volume'
+        })
+
+        # Add symbol column (use 's&p' for S&P 500)
+        df['symbol'] = 's&p' if symbol == '^GSPC' else symbol
+
+        # Select only required columns
+        df = df[['date', 'symbol', 'open', 'high', 'low', 'close', 'volume']]
+
+        all_data.append(df)
+
     if not all_data:
         raise ValueError("No historical price data could be downloaded")
     
@@ -101,136 +220,312 @@ def download_historical_prices(symbols, start_date="2009-01-01", end_date="2020-
     return prices_df
 
 
-def scrape_article(url, publisher):
+def extract_article_text(html, publisher):
     """
-    Scrape full article content from a URL.
-    
+    Extract article text from downloaded HTML.
+
+    Args:
+        html: Raw HTML content of the page (bytes preferred, so decoding
+            happens inside the C parser)
+        publisher: Publisher name (used to determine parsing strategy)
+
+    Returns:
+        Article text or empty string if no article content found
+    """
+    # Parse with Lexbor: tree construction and text extraction both run
+    # entirely in C, an order of magnitude faster than bs4
+    tree = LexborHTMLParser(html)
+
+    # Remove unwanted elements (scripts, styles, nav, ads)
+    for selector in ('script', 'style', 'nav', 'header', 'footer', 'aside'):
+        for node in tree.css(selector):
+            node.decompose()
+
+    article_text = ""
+
+    # Try the publisher's known selectors first, generic ones otherwise
+    for selector in PUBLISHER_SELECTORS.get(publisher, FALLBACK_SELECTORS):
+        container = tree.css_first(selector)
+        if container:
+            article_text = container.text(separator=' ', strip=True)
+            if article_text:
+                break
+
+    # Last resort: join all paragraph tags
+    if not article_text:
+        paragraphs = tree.css('p')
+        if paragraphs:
+            article_text = ' '.join([p.text(strip=True) for p in paragraphs])
+
+    # Clean up text
+    article_text = _WS_RE.sub(' ', article_text).strip()  # Normalize whitespace
+
+    return article_text[:10000]  # Limit to 10000 characters
+
+
+@retry(
+    retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+    wait=wait_exponential_jitter(initial=0.5, max=5),
+    stop=stop_after_attempt(3),
+    reraise=True
+)
+async def _get_with_retry(client, url):
+    # Retry transport failures and retryable status codes with
+    # exponential backoff + jitter; other statuses return as-is
+    response = await client.get(url)
+    if response.status_code in (429, 500, 502, 503, 504):
+        response.raise_for_status()
+    return response
+
+
+async def fetch_article(client, semaphores, url, publisher, delay=1):
+    """
+    Fetch a single article asynchronously and extract its text.
+
     Args:
+        client: Shared httpx AsyncClient
+        semaphores: Per-host semaphores limiting concurrent requests per domain
         url: URL to scrape
         publisher: Publisher name (used to determine parsing strategy)
-    
+        delay: Delay in seconds before releasing the host slot (politeness)
+
     Returns:
         Article text or empty string if scraping fails
     """
-    # Set up headers to mimic a real browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/120.0.0.0 Safari/537.36",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://www.google.com/"
-    }
-    
-    try:
-        # Send GET request with retry logic
-        for attempt in range(3):
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                break
-            sleep(1)  # Wait before retrying
-        
-        if response.status_code != 200:
+    host = urlparse(url).netloc
+
+    # Limit concurrency per host so we don't hammer any single domain
+    async with semaphores[host]:
+        try:
+            response = await _get_with_retry(client, url)
+            if response.status_code != 200:
+                return ""
+            # Skip non-HTML or oversized responses without parsing them
+            if not is_parsable_html(response.headers):
+                return ""
+            # Raw bytes; decoding happens inside the C parser
+            html = response.content
+        except Exception as e:
+            print(f"    Error scraping {url}: {e}")
             return ""
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove unwanted elements (scripts, styles, nav, ads)
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            element.decompose()
-        
-        # Try different strategies based on publisher
-        article_text = ""
-        
-        # Strategy 1: Look for article tag
-        article = soup.find('article')
-        if article:
-            article_text = article.get_text(separator=' ', strip=True)
-        
-        # Strategy 2: Look for common article body classes
-        if not article_text:
-            for class_name in ['article-body', 'article-content', 'entry-content', 
-                              'post-content', 'content-body']:
-                article_div = soup.find('div', class_=lambda x: x and class_name in x.lower() if x else False)
-                if article_div:
-                    article_text = article_div.get_text(separator=' ', strip=True)
-                    break
-        
-        # Strategy 3: Look for paragraph tags within main content
-        if not article_text:
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                article_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
-        
-        # Clean up text
-        article_text = ' '.join(article_text.split())  # Normalize whitespace
-        
-        return article_text[:10000]  # Limit to 10000 characters
-        
-    except Exception as e:
-        print(f"    Error scraping {url}: {e}")
+        finally:
+            # Respect rate limits per host before freeing the slot
+            await asyncio.sleep(delay)
+
+    return extract_article_text(html, publisher)
+
+
+def fetch_articles(urls, publishers, delay=1):
+    """
+    Fetch a list of article URLs concurrently.
+
+    Uses a shared httpx AsyncClient (HTTP/2, bounded connection pool)
+    plus per-host semaphores, so total wall time is ~O(N / concurrency)
+    instead of O(N) while still being polite to each individual domain.
+    Successfully scraped articles are cached on disk keyed by URL, so
+    only URLs not seen before hit the network.
+
+    Args:
+        urls: List of URLs to scrape
+        publishers: List of publisher names (parallel to urls)
+        delay: Delay in seconds between requests to the same host
+
+    Returns:
+        List of article texts (empty string where scraping failed)
+    """
+    async def blocked_url():
+        # Placeholder task for domains we skip entirely
         return ""
 
+    async def download_all(miss_urls, miss_publishers):
+        # HTTP/2 multiplexes article fetches from the same site over one
+        # TLS session; keep-alive covers the HTTP/1.1 hosts
+        limits = httpx.Limits(
+            max_connections=MAX_CONCURRENT_REQUESTS,
+            max_keepalive_connections=MAX_CONCURRENT_REQUESTS
+        )
+        semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_REQUESTS_PER_HOST))
+
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            headers=HEADERS,
+            limits=limits,
+            follow_redirects=True
+        ) as client:
+            tasks = []
+            for url, publisher in zip(miss_urls, miss_publishers):
+                # Check if URL is accessible (skip blocked domains like gurufocus)
+                if 'gurufocus' in url.lower():
+                    print(f"    Skipping gurufocus URL (blocked): {url}")
+                    tasks.append(blocked_url())
+                else:
+                    tasks.append(fetch_article(client, semaphores, url, publisher, delay))
+
+            return await asyncio.gather(*tasks)
+
+    conn = _open_article_cache()
+    try:
+        results = [None] * len(urls)
+        miss_indices = []
+        for i, url in enumerate(urls):
+            row = conn.execute(
+                "SELECT article FROM articles WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None:
+                results[i] = row[0]
+            else:
+                miss_indices.append(i)
+
+        if len(miss_indices) < len(urls):
+            print(f"    {len(urls) - len(miss_indices)}/{len(urls)} articles from cache")
+
+        if miss_indices:
+            fetched = asyncio.run(download_all(
+                [urls[i] for i in miss_indices],
+                [publishers[i] for i in miss_indices]
+            ))
+            for i, article in zip(miss_indices, fetched):
+                results[i] = article
+                # Only cache successful scrapes, so failed URLs are
+                # retried on the next run
+                if article:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO articles VALUES (?, ?)",
+                        (urls[i], article)
+                    )
+            conn.commit()
+    finally:
+        conn.close()
+
+    return results
+
 
 def download_articles(news_df, delay=1):
     """
-    Download full articles for all news items.
-    
+    Download full articles for all news items concurrently.
+
     Args:
         news_df: DataFrame with columns: id, headline, URL, publisher, date, symbol
-        delay: Delay in seconds between requests (to respect rate limits)
-    
+        delay: Delay in seconds between requests to the same host
+
     Returns:
         DataFrame with added 'article' column
     """
     print("Downloading full articles...")
-    
-    articles = []
+
     total = len(news_df)
-    
-    for idx, row in news_df.iterrows():
-        if (idx + 1) % 10 == 0:
-            print(f"  Progress: {idx + 1}/{total}")
-        
-        url = row['URL']
-        publisher = row['publisher']
-        
-        # Check if URL is accessible (skip blocked domains like gurufocus)
-        if 'gurufocus' in url.lower():
-            print(f"    Skipping gurufocus URL (blocked): {url}")
-            articles.append("")
-        else:
-            article_text = scrape_article(url, publisher)
-            articles.append(article_text)
-            
-            # Respect rate limits
-            sleep(delay)
-    
-    news_df['article'] = articles
-    
+
+    # Hoist columns to plain Python lists once, instead of boxing a Series
+    # per row the way iterrows() would
+    urls = news_df['URL'].to_numpy().tolist()
+    publishers = news_df['publisher'].to_numpy().tolist()
+
+    articles = fetch_articles(urls, publishers, delay)
+
+    # Assign as a single object array to avoid per-element inference
+    news_df['article'] = np.asarray(articles, dtype=object)
+
     # Count successful scrapes
     success_count = sum(1 for a in articles if a)
     print(f"Successfully scraped {success_count}/{total} articles")
-    
+
     return news_df
 
 
-def merge_datasets(analyst_ratings_path, headlines_path):
+def stream_articles_to_parquet(news_df, parquet_path, delay=1, batch_size=ARTICLE_BATCH_SIZE):
+    """
+    Download articles in batches and append each batch to a Parquet file.
+
+    Peak memory stays at O(batch_size * article size) instead of holding
+    every scraped article in RAM at once, and a crashed run leaves all
+    completed batches on disk.
+
+    Args:
+        news_df: DataFrame with columns: id, headline, URL, publisher, date, symbol
+        parquet_path: Output Parquet file path
+        delay: Delay in seconds between requests to the same host
+        batch_size: Number of URLs fetched per batch
+
+    Returns:
+        Total number of successfully scraped articles
+    """
+    print("Downloading full articles...")
+
+    total = len(news_df)
+    success_count = 0
+    writer = pq.ParquetWriter(parquet_path, ALL_NEWS_ARROW_SCHEMA)
+
+    try:
+        for start in range(0, total, batch_size):
+            batch = news_df.iloc[start:start + batch_size]
+
+            urls = batch['URL'].to_numpy().tolist()
+            publishers = batch['publisher'].to_numpy().tolist()
+            articles = fetch_articles(urls, publishers, delay)
+
+            batch = batch.assign(article=np.asarray(articles, dtype=object))
+            batch = batch[['id', 'headline', 'URL', 'article', 'publisher', 'date', 'symbol']]
+
+            writer.write_table(
+                pa.Table.from_pandas(batch, schema=ALL_NEWS_ARROW_SCHEMA, preserve_index=False)
+            )
+
+            success_count += sum(1 for a in articles if a)
+            print(f"  Progress: {min(start + batch_size, total)}/{total}")
+    finally:
+        writer.close()
+
+    print(f"Successfully scraped {success_count}/{total} articles")
+
+    return success_count
+
+
+def read_news_csv(path):
+    """
+    Read a news CSV (analyst_ratings/headlines schema) via PyArrow.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        DataFrame with 'date' already parsed as datetime64[ns]
+    """
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(column_types={
+            'id': pa.int64(),
+            'date': pa.timestamp('ns'),
+            'symbol': pa.string(),
+        })
+    )
+    # self_destruct frees the Arrow table as blocks are handed to pandas
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def merge_datasets(analyst_ratings_path, headlines_path, all_news_path):
     """
     Merge analyst_ratings.csv and headlines.csv, add article column, and create all_news.csv.
-    
+
+    Articles are scraped in batches and streamed to a Parquet file next
+    to all_news_path; the CSV is then exported from it in one Arrow pass.
+
     Args:
         analyst_ratings_path: Path to analyst_ratings.csv
         headlines_path: Path to headlines.csv
-    
+        all_news_path: Output path for all_news.csv
+
     Returns:
         DataFrame with schema: id, headline, URL, article, publisher, date, symbol
     """
     print("Merging datasets...")
-    
-    # Load datasets
-    analyst_ratings_df = pd.read_csv(analyst_ratings_path)
-    headlines_df = pd.read_csv(headlines_path)
+
+    # Load datasets with PyArrow's multithreaded CSV reader; pre-typing
+    # the columns skips pandas' type inference and the separate
+    # to_datetime pass over 'date'
+    analyst_ratings_df = read_news_csv(analyst_ratings_path)
+    headlines_df = read_news_csv(headlines_path)
     
     print(f"  Loaded {len(analyst_ratings_df)} analyst ratings")
     print(f"  Loaded {len(headlines_df)} headlines")
@@ -243,26 +538,29 @@ def merge_datasets(analyst_ratings_path, headlines_path):
         analyst_ratings_df[required_cols],
         headlines_df[required_cols]
     ], ignore_index=True)
-    
-    # Reset IDs to be sequential
-    all_news_df['id'] = range(1, len(all_news_df) + 1)
-    
-    # Convert date to datetime
-    all_news_df['date'] = pd.to_datetime(all_news_df['date'])
-    
-    # Sort by date
-    all_news_df = all_news_df.sort_values('date').reset_index(drop=True)
+
+    # Single stable sort by date, in place to avoid another full copy
+    all_news_df.sort_values('date', kind='mergesort', inplace=True)
+    all_news_df.reset_index(drop=True, inplace=True)
+
+    # Reset IDs to be sequential (after sorting, so ids follow date order);
+    # np.arange writes one int64 block instead of boxing a Python range
+    all_news_df['id'] = np.arange(1, len(all_news_df) + 1, dtype=np.int64)
     
     print(f"  Merged dataset has {len(all_news_df)} total news items")
-    
-    # Download articles (this may take a while)
-    # Note: In practice, you might want to batch this or use multiprocessing
-    all_news_df = download_articles(all_news_df, delay=1)
-    
-    # Reorder columns to match schema
-    all_news_df = all_news_df[['id', 'headline', 'URL', 'article', 'publisher', 'date', 'symbol']]
-    
-    return all_news_df
+
+    # Download articles in batches, streaming each batch straight to
+    # Parquet so we never hold every article in memory at once
+    parquet_path = os.path.splitext(all_news_path)[0] + '.parquet'
+    stream_articles_to_parquet(all_news_df, parquet_path, delay=1)
+
+    # One-pass Arrow export of the streamed Parquet to the CSV deliverable
+    pacsv.write_csv(pq.read_table(parquet_path), all_news_path)
+    print(f"Saved to {all_news_path}")
+
+    # Read back for schema validation by the caller (columns are already
+    # in schema order and fully typed)
+    return pd.read_parquet(parquet_path)
 
 
 def main():
@@ -306,10 +604,12 @@ def main():
     analyst_ratings_df = pd.read_csv(analyst_ratings_path)
     headlines_df = pd.read_csv(headlines_path)
     
-    symbols = list(set(
-        analyst_ratings_df['symbol'].dropna().unique().tolist() +
-        headlines_df['symbol'].dropna().unique().tolist()
-    ))
+    # Sorted union of the two symbol columns, computed in numpy instead
+    # of hashing Python strings through set()
+    symbols = np.union1d(
+        analyst_ratings_df['symbol'].dropna().unique(),
+        headlines_df['symbol'].dropna().unique()
+    ).tolist()
     
     print(f"Found {len(symbols)} unique stock symbols")
     
@@ -333,8 +633,10 @@ def main():
     print("Task (b) & (c): Scraping Articles and Merging Datasets")
     print("="*60)
     
-    all_news_df = merge_datasets(analyst_ratings_path, headlines_path)
-    
+    # merge_datasets streams the scraped articles to Parquet and exports
+    # all_news.csv itself; the returned frame is only used for validation
+    all_news_df = merge_datasets(analyst_ratings_path, headlines_path, all_news_path)
+
     # Validate schema
     print("Validating all_news schema...")
     try:
@@ -342,11 +644,7 @@ def main():
         print("  Schema validation passed")
     except Exception as e:
         print(f"  Schema validation failed: {e}")
-    
-    # Save to CSV
-    all_news_df.to_csv(all_news_path, index=False)
-    print(f"Saved to {all_news_path}")
-    
+
     print("\n" + "="*60)
     print("Phase 1.1 Complete!")
     print("="*60)
@@ -1,7 +1,83 @@
+import hashlib
+import json
+import os
 import pandas as pd
 import pandera as pa
 
-def load_and_validate_csv(filepath, schema):
-    df = pd.read_csv(filepath)
-    schema.validate(df, lazy=True)
+def _read_csv_typed(filepath, schema):
+    # Derive dtype/parse_dates hints from the schema so columns come out
+    # of read_csv already typed and Pandera's coerce pass is a no-op
+    dtype_map = {}
+    date_cols = []
+    for name, col in schema.columns.items():
+        if str(col.dtype).startswith("datetime"):
+            date_cols.append(name)
+        elif col.dtype.type is not object:
+            # Nullable int columns can't be read as int64 (NaN); leave
+            # those to inference and let validation coerce them
+            if col.nullable and pd.api.types.is_integer_dtype(col.dtype.type):
+                continue
+            dtype_map[name] = col.dtype.type
+    try:
+        return pd.read_csv(filepath, dtype=dtype_map, parse_dates=date_cols)
+    except (TypeError, ValueError):
+        # Data that doesn't fit the hints (validation will report it)
+        return pd.read_csv(filepath)
+
+def _schema_fingerprint(schema):
+    # Stable digest of everything that affects validation, so the cache
+    # invalidates when a dtype, check or nullability flag changes
+    # (Column's repr alone omits checks and nullability)
+    parts = [
+        (name, str(col.dtype), col.nullable, [str(c) for c in col.checks])
+        for name, col in schema.columns.items()
+    ]
+    return hashlib.md5(repr((parts, schema.coerce)).encode()).hexdigest()
+
+def load_and_validate_csv(filepath, schema, backend="pandas"):
+    # Polars path: on a LazyFrame pandera only runs schema-level
+    # (column/dtype) validation, so schemas with data-level checks must
+    # be collected and validated eagerly or the checks silently no-op
+    if backend == "polars":
+        import polars as pl
+        lf = pl.scan_csv(filepath, try_parse_dates=True)
+        if any(col.checks for col in schema.columns.values()):
+            return schema.validate(lf.collect(), lazy=True)
+        return lf.pipe(schema.validate, lazy=True).collect()
+
+    # Parquet-backed cache: skip CSV parsing and re-validation when the
+    # source file and schema are unchanged since the last load
+    cache_path = filepath + ".parquet"
+    meta_path = cache_path + ".meta"
+    cache_key = {
+        "mtime": os.path.getmtime(filepath),
+        "schema": _schema_fingerprint(schema),
+    }
+
+    if os.path.exists(cache_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path) as f:
+                if json.load(f) == cache_key:
+                    df = pd.read_parquet(cache_path)
+                    # The cache was written after a successful validation
+                    df.attrs["pandera_schema_id"] = id(schema)
+                    return df
+        except (ValueError, OSError):
+            pass  # unreadable cache; fall through to the CSV path
+
+    df = _read_csv_typed(filepath, schema)
+    if df.attrs.get("pandera_schema_id") != id(schema):
+        schema.validate(df, lazy=True)
+        # Mark the frame as validated so callers can skip re-validating it
+        df.attrs["pandera_schema_id"] = id(schema)
+
+    # Cache writes are best-effort: a failure just means the next load
+    # pays the full CSV + validation cost again
+    try:
+        df.to_parquet(cache_path, engine="pyarrow")
+        with open(meta_path, "w") as f:
+            json.dump(cache_key, f)
+    except (ValueError, OSError):
+        pass
+
     return df